@@ -33,10 +33,13 @@ class FilesystemManipulator:
         if spec.get('mount') is None:
             return
         mount = self.model.add_mount(fs, spec['mount'])
-        if self.model.needs_bootloader_partition():
-            vol = fs.volume
-            if vol.type == "partition" and boot.can_be_boot_device(vol.device):
-                self.add_boot_disk(vol.device)
+        vol = fs.volume
+        # Check the volume type first: needs_bootloader_partition() scans the
+        # whole model and is not worth calling for non-partition volumes.
+        if vol.type == "partition" and \
+                self.model.needs_bootloader_partition() and \
+                boot.can_be_boot_device(vol.device):
+            self.add_boot_disk(vol.device)
         return mount
 
     def delete_mount(self, mount):
@@ -85,8 +88,8 @@ class FilesystemManipulator:
         flag = kw.pop('flag', None)
         if gap.in_extended:
             if flag not in (None, 'logical'):
-                log.debug(f'overriding flag {flag} '
-                          'due to being in an extended partition')
+                log.debug('overriding flag %s '
+                          'due to being in an extended partition', flag)
             flag = 'logical'
         part = self.model.add_partition(
             device, size=gap.size, offset=gap.offset, flag=flag, **kw)
@@ -216,7 +219,7 @@ class FilesystemManipulator:
                 disk.wipe = 'superblock-recursive'
 
         needs_boot = self.model.needs_bootloader_partition()
-        log.debug('model needs a bootloader partition? {}'.format(needs_boot))
+        log.debug('model needs a bootloader partition? %s', needs_boot)
         can_be_boot = boot.can_be_boot_device(disk)
         if needs_boot and len(disk.partitions()) == 0 and can_be_boot:
             self.add_boot_disk(disk)
@@ -19,6 +19,7 @@ import collections
 import copy
 import enum
 import fnmatch
+import functools
 import itertools
 import logging
 import math
@@ -601,6 +602,19 @@ class Dasd:
     preserve = attr.ib(default=False)
 
 
+def _rotational_path(dev):
+    return '/sys/class/block/{}/queue/rotational'.format(dev)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_rotational(dev):
+    # Avoid going back to sysfs every time the disk info is displayed.  A
+    # hotplugged disk can reuse a name, so the cache is cleared whenever new
+    # probe data is loaded.
+    with open(_rotational_path(dev), 'r') as f:
+        return f.read().strip()
+
+
 @fsobj("disk")
 class Disk(_Device):
     ptable = attributes.ptable()
@@ -633,15 +647,6 @@ class Disk(_Device):
             bus = 'virtio'
 
         devpath = self._info.raw.get('DEVPATH', self.path)
-        # XXX probert should be doing this!!
-        rotational = '1'
-        try:
-            dev = os.path.basename(devpath)
-            rfile = '/sys/class/block/{}/queue/rotational'.format(dev)
-            with open(rfile, 'r') as f:
-                rotational = f.read().strip()
-        except (PermissionError, FileNotFoundError, IOError):
-            log.exception('WARNING: Failed to read file {}'.format(rfile))
 
         dinfo = {
             'bus': bus,
@@ -654,7 +659,7 @@ class Disk(_Device):
             'size': self.size,
             'humansize': humanize_size(self.size),
             'vendor': self._info.vendor or 'unknown',
-            'rotational': 'true' if rotational == '1' else 'false',
+            'rotational': 'true' if self.rotational else 'false',
         }
         return dinfo
 
@@ -700,6 +705,18 @@ class Disk(_Device):
     def vendor(self):
         return self._decode_id('ID_VENDOR_ENC')
 
+    @property
+    def rotational(self):
+        # XXX probert should be doing this!!
+        devpath = self._info.raw.get('DEVPATH', self.path)
+        dev = os.path.basename(devpath)
+        try:
+            return _read_rotational(dev) == '1'
+        except (PermissionError, FileNotFoundError, IOError):
+            log.exception(
+                'WARNING: Failed to read file %s', _rotational_path(dev))
+            return True
+
     def _decode_id(self, id):
         id = self._info.raw.get(id)
         if id is None:
@@ -1165,6 +1182,7 @@ class FilesystemModel(object):
 
     def load_server_data(self, status):
         log.debug('load_server_data %s', status)
+        _read_rotational.cache_clear()
         self._all_ids = set()
         self.storage_version = status.storage_version
         self._orig_config = status.orig_config
@@ -1207,7 +1225,7 @@ class FilesystemModel(object):
                 _udev_val(disk, "DEVPATH"), match['devpath'])
 
         def match_ssd(disk):
-            is_ssd = disk.info_for_display()['rotational'] == 'false'
+            is_ssd = not disk.rotational
             return is_ssd == match['ssd']
 
         def match_install_media(disk):
@@ -1557,6 +1575,7 @@ class FilesystemModel(object):
         return config
 
     def load_probe_data(self, probe_data):
+        _read_rotational.cache_clear()
         for devname, devdata in probe_data['blockdev'].items():
             if int(devdata['attrs']['size']) != 0:
                 continue
@@ -31,6 +31,7 @@ from subiquity.models.filesystem import (
     humanize_size,
     NotFinalPartitionError,
     Partition,
+    _read_rotational,
     align_down,
     LVM_CHUNK_SIZE,
     )
@@ -138,6 +139,7 @@ class FakeStorageInfo:
     free = attr.ib(default=None)
     serial = attr.ib(default=None)
     model = attr.ib(default=None)
+    vendor = attr.ib(default=None)
     raw = attr.ib(default=attr.Factory(dict))
 
 
@@ -531,6 +533,46 @@ class TestAutoInstallConfig(unittest.TestCase):
         new_disk = model._one(type="disk", id="disk0")
         self.assertEqual(new_disk.serial, d1.serial)
 
+    def _test_ssd(self, rotational, ssd):
+        model = make_model()
+        make_disk(model, serial='aaaa')
+        make_disk(model, serial='bbbb')
+        fake_up_blockdata(model)
+
+        def read_rotational(dev):
+            value = rotational[dev]
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        p = mock.patch('subiquity.models.filesystem._read_rotational',
+                       side_effect=read_rotational)
+        with p:
+            model.apply_autoinstall_config([
+                {
+                    'type': 'disk',
+                    'id': 'disk0',
+                    'match': {
+                        'ssd': ssd,
+                        },
+                },
+                ])
+        return model._one(type="disk", id="disk0")
+
+    def test_ssd_true(self):
+        new_disk = self._test_ssd({'thing0': '1', 'thing1': '0'}, True)
+        self.assertEqual(new_disk.serial, 'bbbb')
+
+    def test_ssd_false(self):
+        new_disk = self._test_ssd({'thing0': '1', 'thing1': '0'}, False)
+        self.assertEqual(new_disk.serial, 'aaaa')
+
+    def test_ssd_read_failure_is_rotational(self):
+        rotational = {'thing0': '0', 'thing1': FileNotFoundError()}
+        with self.assertLogs('subiquity.models.filesystem', level='ERROR'):
+            new_disk = self._test_ssd(rotational, False)
+        self.assertEqual(new_disk.serial, 'bbbb')
+
     def test_no_matching_disk(self):
         model = make_model()
         make_disk(model, serial='bbbb')
@@ -1205,6 +1247,49 @@ class TestSwap(unittest.TestCase):
             self.assertEqual({'size': 0}, cfg['swap'])
 
 
+class TestRotational(unittest.TestCase):
+
+    def setUp(self):
+        _read_rotational.cache_clear()
+        self.addCleanup(_read_rotational.cache_clear)
+
+    def test_cache_cleared_on_probe(self):
+        model, disk = make_model_and_disk()
+        p_open = mock.patch(
+            'subiquity.models.filesystem.open', create=True,
+            new_callable=mock.mock_open, read_data='1\n')
+        with p_open as m_open:
+            self.assertTrue(disk.rotational)
+            self.assertTrue(disk.rotational)
+            m_open.assert_called_once_with(
+                '/sys/class/block/thing0/queue/rotational', 'r')
+        with mock.patch.object(model, 'reset'):
+            model.load_probe_data({'blockdev': {}})
+        p_open = mock.patch(
+            'subiquity.models.filesystem.open', create=True,
+            new_callable=mock.mock_open, read_data='0\n')
+        with p_open:
+            self.assertFalse(disk.rotational)
+
+    @parameterized.expand([
+        ('0', 'false'),
+        ('1', 'true'),
+        ])
+    def test_info_for_display(self, value, expected):
+        _, disk = make_model_and_disk()
+        with mock.patch('subiquity.models.filesystem._read_rotational',
+                        return_value=value):
+            self.assertEqual(expected, disk.info_for_display()['rotational'])
+
+    def test_info_for_display_read_failure(self):
+        _, disk = make_model_and_disk()
+        p = mock.patch('subiquity.models.filesystem._read_rotational',
+                       side_effect=FileNotFoundError)
+        with p, self.assertLogs('subiquity.models.filesystem', level='ERROR'):
+            self.assertTrue(disk.rotational)
+            self.assertEqual('true', disk.info_for_display()['rotational'])
+
+
 class TestPartition(unittest.TestCase):
 
     def test_is_logical(self):
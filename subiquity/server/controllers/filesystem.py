@@ -307,7 +307,7 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
             lv_size = vg.size
         else:
             raise Exception(f'Unhandled size policy {choice.sizing_policy}')
-        log.debug(f'lv_size {lv_size} for {choice.sizing_policy}')
+        log.debug('lv_size %s for %s', lv_size, choice.sizing_policy)
         self.create_logical_volume(
             vg=vg, spec=dict(
                 size=lv_size,
@@ -931,7 +931,7 @@ class FilesystemController(SubiquityController, FilesystemManipulator):
                 continue
             finally:
                 elapsed = time.time() - start
-                log.debug(f'{short_label} probing took {elapsed:.1f} seconds')
+                log.debug('%s probing took %.1f seconds', short_label, elapsed)
             break
 
     async def run_autoinstall_guided(self, layout):
@@ -221,7 +221,7 @@ class VolGroupStretchy(Stretchy):
         safe_result = result.copy()
         if 'passphrase' in safe_result:
             safe_result['passphrase'] = '<REDACTED>'
-        log.debug("vg_done: {}".format(safe_result))
+        log.debug("vg_done: %s", safe_result)
         self.parent.controller.volgroup_handler(self.existing, result)
         self.parent.refresh_model_inputs()
         self.parent.remove_overlay()
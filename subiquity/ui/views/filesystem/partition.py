@@ -544,8 +544,8 @@ class PartitionStretchy(Stretchy):
         self.parent.remove_overlay()
 
     def done(self, form):
-        log.debug("Add Partition Result: {}".format(form.as_data()))
         spec = form.as_data()
+        log.debug("Add Partition Result: %s", spec)
         if self.partition is not None and boot.is_esp(self.partition):
             if self.partition.original_fstype() is None:
                 spec['fstype'] = self.partition.fs().fstype
@@ -610,7 +610,8 @@ class FormatEntireStretchy(Stretchy):
         self.parent.remove_overlay()
 
     def done(self, form):
-        log.debug("Format Entire Result: {}".format(form.as_data()))
-        self.controller.add_format_handler(self.device, form.as_data())
+        spec = form.as_data()
+        log.debug("Format Entire Result: %s", spec)
+        self.controller.add_format_handler(self.device, spec)
         self.parent.refresh_model_inputs()
         self.parent.remove_overlay()
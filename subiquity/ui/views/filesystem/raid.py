@@ -206,7 +206,7 @@ class RaidStretchy(Stretchy):
         mdc = self.form.devices.widget
         result['devices'] = mdc.active_devices
         result['spare_devices'] = mdc.spare_devices
-        log.debug('raid_done: result = {}'.format(result))
+        log.debug('raid_done: result = %s', result)
         self.parent.controller.raid_handler(self.existing, result)
         self.parent.refresh_model_inputs()
         self.parent.remove_overlay()
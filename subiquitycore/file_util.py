@@ -25,6 +25,9 @@ import yaml
 
 _DEF_PERMS_FILE = 0o640
 _DEF_GROUP = 'adm'
+# yaml.dump() emits many small chunks; buffer them so that a config is
+# written out in a handful of large writes.
+_CONFIG_YAML_BUFFER_SIZE = 512 * 1024
 
 log = logging.getLogger('subiquitycore.file_util')
 
@@ -45,7 +48,7 @@ def set_log_perms(target, *, isdir=True, group_write=False, mode=None):
 
 
 @contextlib.contextmanager
-def open_perms(filename, *, cmode=None):
+def open_perms(filename, *, cmode=None, buffering=-1):
     if cmode is None:
         cmode = _DEF_PERMS_FILE
 
@@ -53,7 +56,8 @@ def open_perms(filename, *, cmode=None):
     try:
         dirname = os.path.dirname(filename)
         os.makedirs(dirname, exist_ok=True)
-        tf = tempfile.NamedTemporaryFile(dir=dirname, delete=False, mode='w')
+        tf = tempfile.NamedTemporaryFile(
+            dir=dirname, delete=False, mode='w', buffering=buffering)
         yield tf
         tf.close()
         set_log_perms(tf.name, mode=cmode)
@@ -75,9 +79,10 @@ def generate_timestamped_header() -> str:
 
 
 def generate_config_yaml(filename, content, **kwargs):
+    kwargs.setdefault('buffering', _CONFIG_YAML_BUFFER_SIZE)
     with open_perms(filename, **kwargs) as tf:
         tf.write(generate_timestamped_header())
-        tf.write(yaml.dump(content))
+        yaml.dump(content, tf)
 
 
 def copy_file_if_exists(source: str, target: str):
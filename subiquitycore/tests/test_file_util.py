@@ -13,7 +13,12 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from subiquitycore.file_util import copy_file_if_exists
+from unittest.mock import patch
+
+from subiquitycore.file_util import (
+    copy_file_if_exists,
+    generate_config_yaml,
+    )
 from subiquitycore.tests import SubiTestCase
 
 
@@ -29,3 +34,13 @@ class TestCopy(SubiTestCase):
 
     def test_copied_non_exist_src(self):
         copy_file_if_exists('/does/not/exist', '/ditto')
+
+
+@patch('subiquitycore.file_util.generate_timestamped_header',
+       return_value='# header\n')
+@patch('subiquitycore.file_util.set_log_perms')
+class TestGenerateConfigYaml(SubiTestCase):
+    def test_config_written(self, m_perms, m_header):
+        tgt = self.tmp_path('create-me/config.yaml')
+        generate_config_yaml(tgt, {'a': [1, 2]})
+        self.assert_contents(tgt, '# header\na:\n- 1\n- 2\n')
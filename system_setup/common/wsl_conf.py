@@ -155,7 +155,7 @@ def wsl_config_update(config_class, root_dir):
                     systemd_experimental_section = True
                     config_api_name = "systemd_enabled"
 
-                config_value = config_class.__dict__[config_api_name]
+                config_value = getattr(config_class, config_api_name)
                 if isinstance(config_value, bool):
                     config_value = str(config_value).lower()
 
@@ -19,7 +19,7 @@ import attr
 log = logging.getLogger('system_setup.models.wslconfbase')
 
 
-@attr.s
+@attr.s(slots=True, frozen=True)
 class WSLConfigurationBase(object):
     automount_root = attr.ib()
     automount_options = attr.ib()
@@ -36,8 +36,11 @@ class WSLConfigurationBaseModel(object):
         # TODO WSL: Load settings from system
 
     def apply_settings(self, result):
-        d = result.__dict__
-        self._wslconfbase = WSLConfigurationBase(**d)
+        self._wslconfbase = WSLConfigurationBase(
+            result.automount_root,
+            result.automount_options,
+            result.network_generatehosts,
+            result.network_generateresolvconf)
 
     @property
     def wslconfbase(self):